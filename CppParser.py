@@ -8,19 +8,78 @@ Features both command line and GUI interfaces.
 """
 
 import re
-import os
 import sys
-import argparse
-from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# Precompiled patterns for parameter normalization.  These are applied once
+# per header signature and once per source function, so compiling them at
+# module level avoids re-running the regex compiler inside the hot path.
+_RE_DEFAULT_VALUE = re.compile(r'\s*=\s*[^,)]+')
+_RE_PARAM_NAME = re.compile(r'(\w+)\s+(\w+)(?=[,)])')
+_RE_WHITESPACE = re.compile(r'\s+')
+
+# Combined header-scan pattern: one MULTILINE finditer pass visits every
+# scope event and declaration in document order inside the regex engine,
+# instead of running several searches per line from Python.  The function
+# alternative mirrors CppParser.header_func_pattern with named groups.
+_HEADER_SCAN_RE = re.compile(
+    r'namespace\s+(?P<ns_name>\w+)\s*{'
+    r'|class\s+(?P<cls_name>\w+)\s*(?::\s*(?:public|protected|private)\s+\w+\s*)?{'
+    r'|^[ \t]*(?P<ns_end>})[ \t\r]*$'
+    r'|^[ \t]*(?P<cls_end>};)[ \t\r]*$'
+    r'|(?:virtual\s+)?(?:static\s+)?(?:const\s+)?(?:inline\s+)?'
+    r'(?:explicit\s+)?(?:[a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?\s+)?'  # return type
+    r'(?P<fn_name>[a-zA-Z_]\w*)\s*'  # function name
+    r'\((?P<fn_params>[^)]*)\)\s*'  # parameters
+    r'(?:const\s*)?(?:noexcept\s*)?(?:override\s*)?(?:final\s*)?'
+    r'(?:=\s*0\s*)?(?:=\s*default\s*)?(?:=\s*delete\s*)?'
+    r';',  # semicolon
+    re.MULTILINE)
+
+# Comments and string/char literals, matched in one alternation so a
+# single pass can blank them out before any brace counting or signature
+# matching happens
+_RE_COMMENTS_STRINGS = re.compile(
+    r'//[^\n]*'
+    r'|/\*.*?\*/'
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'",
+    re.DOTALL)
+_RE_NON_NEWLINE = re.compile(r'[^\n]')
+
+
+def _strip_comments_and_strings(text):
+    """Blank out comments and literals while preserving line structure
+
+    Returns a same-length copy of *text* with every comment and string or
+    character literal replaced by spaces. Braces and stray parentheses
+    inside them then can't corrupt boundary detection, while the
+    untouched original keeps the text that ends up in the output.
+    """
+    return _RE_COMMENTS_STRINGS.sub(
+        lambda m: _RE_NON_NEWLINE.sub(' ', m.group(0)), text)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_params(params_str):
+    """Normalize a parameter string (cached; identical lists recur often)"""
+    normalized = _RE_DEFAULT_VALUE.sub('', params_str)  # Remove default values
+    normalized = _RE_PARAM_NAME.sub(r'\1', normalized)  # Remove parameter names
+    normalized = _RE_WHITESPACE.sub('', normalized)  # Remove whitespace
+    return normalized
+
 class FunctionInfo:
     """Class to store information about a function"""
-    def __init__(self, name, signature, full_text, index):
+    __slots__ = ('name', 'signature', 'full_text', 'index', 'end_index')
+
+    def __init__(self, name, signature, full_text, index, end_index):
         self.name = name
         self.signature = signature
         self.full_text = full_text
         self.index = index  # Original position in the file
+        self.end_index = end_index  # Last line of the function body
 
     def __repr__(self):
         return f"FunctionInfo(name={self.name}, index={self.index})"
@@ -28,46 +87,98 @@ class FunctionInfo:
 class CppParser:
     """Parser for C++ header and source files"""
 
+    # Regex patterns for C++ parsing, compiled once per process instead of
+    # per instance (the GUI creates a parser per run)
+    class_pattern = re.compile(r'class\s+(\w+)\s*(?::\s*(?:public|protected|private)\s+\w+\s*)?{')
+    namespace_pattern = re.compile(r'namespace\s+(\w+)\s*{')
+    header_func_pattern = re.compile(
+        r'(?:virtual\s+)?(?:static\s+)?(?:const\s+)?(?:inline\s+)?'
+        r'(?:explicit\s+)?(?:[a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?\s+)?'  # return type
+        r'([a-zA-Z_]\w*)\s*'  # function name
+        r'\(([^)]*)\)\s*'  # parameters
+        r'(?:const\s*)?(?:noexcept\s*)?(?:override\s*)?(?:final\s*)?'
+        r'(?:=\s*0\s*)?(?:=\s*default\s*)?(?:=\s*delete\s*)?'
+        r';'  # semicolon
+    )
+    cpp_func_pattern = re.compile(
+        r'(?:static\s+)?(?:inline\s+)?'
+        r'(?:[a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?\s+)?'  # return type
+        r'([a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?)\s*::\s*([a-zA-Z_]\w*)\s*'  # class::function
+        r'\(([^)]*)\)\s*'  # parameters
+        r'(?:const\s*)?(?:noexcept\s*)?(?:override\s*)?(?:final\s*)?'
+        r'(?:try\s*)?'
+        r'{'  # opening brace
+    )
+    # Pattern for standalone (non-member) functions
+    standalone_func_pattern = re.compile(
+        r'(?:static\s+)?(?:inline\s+)?'
+        r'(?:[a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?\s+)'  # return type
+        r'([a-zA-Z_]\w*)\s*'  # function name
+        r'\(([^)]*)\)\s*'  # parameters
+        r'(?:const\s*)?(?:noexcept\s*)?'
+        r'(?:try\s*)?'
+        r'{'  # opening brace
+    )
+
     def __init__(self):
-        # Regex patterns for C++ parsing
-        self.class_pattern = re.compile(r'class\s+(\w+)\s*(?::\s*(?:public|protected|private)\s+\w+\s*)?{')
-        self.namespace_pattern = re.compile(r'namespace\s+(\w+)\s*{')
-        self.header_func_pattern = re.compile(
-            r'(?:virtual\s+)?(?:static\s+)?(?:const\s+)?(?:inline\s+)?'
-            r'(?:explicit\s+)?(?:[a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?\s+)?'  # return type
-            r'([a-zA-Z_]\w*)\s*'  # function name
-            r'\(([^)]*)\)\s*'  # parameters
-            r'(?:const\s*)?(?:noexcept\s*)?(?:override\s*)?(?:final\s*)?'
-            r'(?:=\s*0\s*)?(?:=\s*default\s*)?(?:=\s*delete\s*)?'
-            r';'  # semicolon
-        )
-        self.cpp_func_pattern = re.compile(
-            r'(?:static\s+)?(?:inline\s+)?'
-            r'(?:[a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?\s+)?'  # return type
-            r'([a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?)\s*::\s*([a-zA-Z_]\w*)\s*'  # class::function
-            r'\(([^)]*)\)\s*'  # parameters
-            r'(?:const\s*)?(?:noexcept\s*)?(?:override\s*)?(?:final\s*)?'
-            r'(?:try\s*)?'
-            r'{'  # opening brace
-        )
-        # Pattern for standalone (non-member) functions
-        self.standalone_func_pattern = re.compile(
-            r'(?:static\s+)?(?:inline\s+)?'
-            r'(?:[a-zA-Z_]\w*(?:::[a-zA-Z_]\w*)?\s+)'  # return type
-            r'([a-zA-Z_]\w*)\s*'  # function name
-            r'\(([^)]*)\)\s*'  # parameters
-            r'(?:const\s*)?(?:noexcept\s*)?'
-            r'(?:try\s*)?'
-            r'{'  # opening brace
-        )
+        # Lookup index for find_matching_function, built lazily per
+        # header_functions dict (see _build_match_index), plus the set of
+        # simple names it covers for a cheap pre-filter
+        self._match_index = None
+        self._match_index_for = None
+        self._match_names = None
+        # Cache of the last header parse, keyed by content hash, so repeat
+        # runs against an unchanged header skip the line-by-line scan
+        self._header_cache = None
+        # Cache of the last line split, so extract_cpp_functions and
+        # reorder_cpp_content don't each re-split the same source string
+        self._lines_cache = None
+        self._offsets_cache = None
+        self._masked_cache = None
+
+    def _split_lines(self, content):
+        """Split content into lines once and reuse for the same string object"""
+        cached = self._lines_cache
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        lines = content.split('\n')
+        self._lines_cache = (content, lines)
+        return lines
+
+    def _masked_lines(self, content):
+        """Lines of the comment/string-masked copy, cached like the split
+
+        extract_cpp_functions and reorder_cpp_content both need the masked
+        view of the same source string; masking it once covers both.
+        """
+        cached = self._masked_cache
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        masked = _strip_comments_and_strings(content).split('\n')
+        self._masked_cache = (content, masked)
+        return masked
+
+    def _line_offsets(self, content):
+        """Character offset of each line start, plus one terminal entry
+
+        Lets callers slice line ranges straight out of the original
+        string instead of joining line lists back together.
+        """
+        cached = self._offsets_cache
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        offsets = [0]
+        append = offsets.append
+        acc = 0
+        for line in self._split_lines(content):
+            acc += len(line) + 1
+            append(acc)
+        self._offsets_cache = (content, offsets)
+        return offsets
 
     def normalize_params(self, params_str):
         """Normalize parameter string to help with matching"""
-        # Remove parameter names, default values, and whitespace
-        normalized = re.sub(r'\s*=\s*[^,)]+', '', params_str)  # Remove default values
-        normalized = re.sub(r'(\w+)\s+(\w+)(?=[,)])', r'\1', normalized)  # Remove parameter names
-        normalized = re.sub(r'\s+', '', normalized)  # Remove whitespace
-        return normalized
+        return _normalize_params(params_str)
 
     def compare_params(self, params1, params2):
         """Compare parameter lists to determine if they match"""
@@ -79,143 +190,181 @@ class CppParser:
 
     def extract_header_functions(self, header_content):
         """Extract function declarations from header file"""
+        cache_key = hash(header_content)
+        if self._header_cache and self._header_cache[0] == cache_key:
+            return self._header_cache[1]
+
         current_class = None
         current_namespace = None
         namespaces = []
         functions = {}
+        match_index = {}
+
+        # Qualification prefix, rebuilt only when the enclosing scope
+        # changes rather than for every declaration inside it
+        scope_prefix = ''
+
+        # One combined finditer pass over the masked content (comments and
+        # literals blanked out) yields scope events and declarations in
+        # document order, replacing the per-line multi-search loop
+        for m in _HEADER_SCAN_RE.finditer(_strip_comments_and_strings(header_content)):
+            func_name = m.group('fn_name')
+            if func_name is not None:
+                # Create fully qualified name with namespace and class if available
+                qualified_name = scope_prefix + func_name
 
-        # Split by lines to track classes and namespaces
-        lines = header_content.split('\n')
+                # Normalize once and reuse the result for both the display
+                # signature and the tuple match key, rather than formatting
+                # a string here and re-parsing it when the index is built
+                norm_params = self.normalize_params(m.group('fn_params'))
+                signature = f"{qualified_name}({norm_params})"
+                functions[signature] = qualified_name
+                match_index.setdefault((func_name, norm_params), signature)
+                continue
 
-        for i, line in enumerate(lines):
-            # Track namespaces
-            namespace_match = self.namespace_pattern.search(line)
-            if namespace_match:
-                current_namespace = namespace_match.group(1)
+            # Track namespaces and classes
+            if m.group('ns_name') is not None:
+                current_namespace = m.group('ns_name')
                 namespaces.append(current_namespace)
-
-            # Check for namespace end
-            if line.strip() == '}' and namespaces:
+            elif m.group('ns_end') is not None:
+                if not namespaces:
+                    continue
                 namespaces.pop()
                 current_namespace = namespaces[-1] if namespaces else None
-
-            # Track classes
-            class_match = self.class_pattern.search(line)
-            if class_match:
-                current_class = class_match.group(1)
-
-            # Check for class end
-            if line.strip() == '};':
+            elif m.group('cls_name') is not None:
+                current_class = m.group('cls_name')
+            else:  # cls_end
                 current_class = None
 
-            # Extract function declarations
-            func_match = self.header_func_pattern.search(line)
-            if func_match:
-                func_name = func_match.group(1)
-                params = func_match.group(2)
-
-                # Create fully qualified name with namespace and class if available
-                qualified_name = func_name
-                if current_class:
-                    qualified_name = f"{current_class}::{func_name}"
-                if current_namespace:
-                    qualified_name = f"{current_namespace}::{qualified_name}"
-
-                signature = self.get_function_signature(qualified_name, params)
-                functions[signature] = qualified_name
+            scope_prefix = ''
+            if current_namespace:
+                scope_prefix = current_namespace + '::'
+            if current_class:
+                scope_prefix += current_class + '::'
 
+        self._header_cache = (cache_key, functions)
+        self._match_index = match_index
+        self._match_index_for = functions
+        self._match_names = {name for name, _ in match_index}
         return functions
 
+    def _build_match_index(self, header_functions):
+        """Index header functions by (simple name, normalized params) for O(1) lookup"""
+        index = {}
+        for header_sig, header_name in header_functions.items():
+            simple_name = header_name.split('::')[-1]
+            params = header_sig.split('(', 1)[1].rstrip(')')
+            index.setdefault((simple_name, self.normalize_params(params)), header_sig)
+        return index
+
     def find_matching_function(self, cpp_name, cpp_params, header_functions):
         """Find matching header function for cpp implementation"""
+        # Build the hashed (simple name, normalized params) index once per
+        # header_functions dict instead of scanning every header entry for
+        # every source function
+        if self._match_index_for is not header_functions:
+            self._match_index = self._build_match_index(header_functions)
+            self._match_index_for = header_functions
+            self._match_names = {name for name, _ in self._match_index}
+
+        # O(1) name pre-filter: a function the header never declares can
+        # skip parameter normalization entirely
+        simple_name = cpp_name.split('::')[-1]
+        if simple_name not in self._match_names:
+            return None
+
+        # Normalize once and share between the direct and indexed lookups
+        norm_params = self.normalize_params(cpp_params)
+
         # Try direct match first
-        signature = self.get_function_signature(cpp_name, cpp_params)
+        signature = f"{cpp_name}({norm_params})"
         if signature in header_functions:
             return signature
 
-        # Try matching just by name and parameters
-        for header_sig, header_name in header_functions.items():
-            # Extract name from fully qualified header name
-            parts = header_name.split('::')
-            simple_name = parts[-1]
-
-            if simple_name == cpp_name and self.compare_params(header_sig.split('(')[1], cpp_params):
-                return header_sig
-
-        return None
+        return self._match_index.get((simple_name, norm_params))
 
     def extract_cpp_functions(self, cpp_content, header_functions):
         """Extract function implementations from cpp file"""
+        # Pre-flight: with no header declarations nothing can match, so
+        # skip the whole source scan
+        if not header_functions:
+            return []
+
         functions = []
         function_blocks = []
         current_block = []
         brace_count = 0
         in_function = False
 
-        # Split content by lines for initial processing
-        lines = cpp_content.split('\n')
+        # Split content by lines for initial processing.  Boundary
+        # detection runs on the masked copy so braces inside comments and
+        # literals don't skew the depth count; the extracted text itself
+        # still comes from the original lines.
+        lines = self._split_lines(cpp_content)
+        masked_lines = self._masked_lines(cpp_content)
+
+        # Bind the pattern lookups once; the loop below runs per line and
+        # repeated attribute resolution is measurable interpreter overhead
+        member_search = self.cpp_func_pattern.search
+        standalone_search = self.standalone_func_pattern.search
 
         # First pass: identify function boundaries
         i = 0
-        while i < len(lines):
-            line = lines[i]
+        while i < len(masked_lines):
+            line = masked_lines[i]
 
             if not in_function:
-                # Check for member function implementation
-                member_match = self.cpp_func_pattern.search(line)
-                standalone_match = self.standalone_func_pattern.search(line)
-
-                if member_match:
-                    class_name = member_match.group(1)
-                    func_name = member_match.group(2)
-                    params = member_match.group(3)
-
-                    qualified_name = f"{class_name}::{func_name}"
-                    in_function = True
-                    brace_count = 1
-                    current_block = [i]  # Start index
+                # Both function patterns require a parameter list, so a
+                # line without '(' can never start a function — skip the
+                # regex work entirely for such lines
+                if '(' not in line:
+                    i += 1
+                    continue
 
-                elif standalone_match:
-                    func_name = standalone_match.group(1)
-                    params = standalone_match.group(2)
+                # Check for member function implementation
+                member_match = member_search(line)
+                standalone_match = None if member_match else standalone_search(line)
 
-                    qualified_name = func_name
+                if member_match or standalone_match:
                     in_function = True
                     brace_count = 1
-                    current_block = [i]  # Start index
+                    # Keep the match object so the second pass doesn't
+                    # have to re-run the regexes on the signature line
+                    current_block = [i, member_match or standalone_match,
+                                     member_match is not None]
             else:
-                # Count braces to find function end
-                brace_count += line.count('{')
-                brace_count -= line.count('}')
-
-                if brace_count == 0:
-                    # Function ended
-                    current_block.append(i)  # End index
-                    function_blocks.append(current_block)
-                    current_block = []
-                    in_function = False
+                # Count braces to find function end; most body lines have
+                # no braces at all, so one membership test gates the scans
+                if '{' in line or '}' in line:
+                    brace_count += line.count('{') - line.count('}')
+
+                    if brace_count == 0:
+                        # Function ended
+                        start_idx, match, is_member = current_block
+                        function_blocks.append((start_idx, i, match, is_member))
+                        current_block = []
+                        in_function = False
 
             i += 1
 
-        # Second pass: extract actual function text and match with header
-        for start_idx, end_idx in function_blocks:
-            func_text = '\n'.join(lines[start_idx:end_idx+1])
+        # Second pass: extract actual function text and match with header,
+        # reusing the match objects captured during boundary detection.
+        # Function text is sliced straight from the source string via the
+        # offset table rather than re-joining line lists.
+        offsets = self._line_offsets(cpp_content)
+        for start_idx, end_idx, match, is_member in function_blocks:
+            func_text = cpp_content[offsets[start_idx]:offsets[end_idx + 1] - 1]
 
             # Extract function details
-            member_match = self.cpp_func_pattern.search(lines[start_idx])
-            standalone_match = self.standalone_func_pattern.search(lines[start_idx])
-
-            if member_match:
-                class_name = member_match.group(1)
-                func_name = member_match.group(2)
-                params = member_match.group(3)
+            if is_member:
+                class_name = match.group(1)
+                func_name = match.group(2)
+                params = match.group(3)
                 qualified_name = f"{class_name}::{func_name}"
-            elif standalone_match:
-                func_name = standalone_match.group(1)
-                params = standalone_match.group(2)
-                qualified_name = func_name
             else:
-                continue  # Skip if not a recognized function
+                func_name = match.group(1)
+                params = match.group(2)
+                qualified_name = func_name
 
             # Find matching header function
             header_sig = self.find_matching_function(qualified_name, params, header_functions)
@@ -225,7 +374,8 @@ class CppParser:
                     name=qualified_name,
                     signature=header_sig,
                     full_text=func_text,
-                    index=start_idx
+                    index=start_idx,
+                    end_index=end_idx
                 )
                 functions.append(func_info)
 
@@ -239,8 +389,11 @@ class CppParser:
           for func in functions:
               log_func(f"  - {func.signature} (Line: {func.index})")
 
-        # Sort functions according to their order in the header file
-        sorted_functions = sorted(functions, key=lambda f: function_order.get(f.signature, float('inf')))
+        # Sort functions according to their order in the header file.
+        # Unmatched functions sink to the end; an int sentinel keeps the
+        # sort comparisons homogeneous (no float/int mixing).
+        unmatched = len(function_order)
+        sorted_functions = sorted(functions, key=lambda f: function_order.get(f.signature, unmatched))
 
         if log_func:
           log_func("\nFunction order in the .h file (desired order):")
@@ -252,48 +405,52 @@ class CppParser:
               log_func(f"  - {func.signature}")
           log_func("--- End of Function Reordering Analysis ---\n")
 
-        # Split content into lines
-        lines = cpp_content.split('\n')
+        # Split content into lines (reuses the extract_cpp_functions split)
+        lines = self._split_lines(cpp_content)
+
+        # Strip each line once up front; the comment lookback below then
+        # works on plain list indexing with no per-iteration string ops
+        stripped_lines = [ln.strip() for ln in lines]
+        masked_lines = self._masked_lines(cpp_content)
 
-        # Find blocks of code for each function
+        # Find blocks of code for each function, reusing the extents that
+        # extract_cpp_functions already computed instead of rescanning the
+        # file for each signature
         blocks = []
-        marked_lines = set()
+        comments = {}
 
         for func in functions:
-            # Find the start and end lines of this function
-            match_line = -1
-            for i, line in enumerate(lines):
-                if i in marked_lines:
+            start_line = func.index
+            end_line = func.end_index
+
+            # Attach the comment block sitting above the signature so it
+            # moves with the function instead of being left behind.  A
+            # line counts as comment only if the masking pass blanks it
+            # entirely; prefix checks on stripped lines mis-read block
+            # comment interiors and could move half of a /* ... */ pair.
+            comment_start = start_line
+            j = start_line - 1
+            while j >= 0:
+                if stripped_lines[j] == '':
+                    j -= 1
                     continue
+                if masked_lines[j].strip() == '':
+                    comment_start = j
+                    j -= 1
+                    continue
+                break
 
-                # Check if this line contains the function signature
-                if (self.cpp_func_pattern.search(line) or
-                    self.standalone_func_pattern.search(line)) and func.full_text.startswith(line):
-                    match_line = i
-                    break
-
-            if match_line < 0:
-                continue
-
-            # Find the end of the function
-            brace_count = 0
-            start_line = match_line
-            end_line = match_line
-
-            for i in range(match_line, len(lines)):
-                line = lines[i]
-                brace_count += line.count('{')
-                brace_count -= line.count('}')
-                end_line = i
-
-                if brace_count == 0:
-                    break
-
-            # Mark these lines as part of a function
-            for i in range(start_line, end_line + 1):
-                marked_lines.add(i)
+            if comment_start < start_line:
+                comment = '\n'.join(lines[comment_start:start_line])
+                # A block whose /* opener shares a line with code sits just
+                # above the lookback window; only a region that masks away
+                # on its own is a complete comment and safe to move
+                if _strip_comments_and_strings(comment).strip() == '':
+                    comments[func] = comment
+                else:
+                    comment_start = start_line
 
-            blocks.append((start_line, end_line, func))
+            blocks.append((comment_start, end_line, func))
 
         # Separate functions from the rest of the content
         content_blocks = []
@@ -320,9 +477,13 @@ class CppParser:
             new_content.append(content_blocks[0][0])
             content_blocks.pop(0)
 
-        # Add functions in the sorted order
+        # Add functions in the sorted order, each preceded by its comment
         for func in sorted_functions:
-            new_content.append(func.full_text)
+            comment = comments.get(func)
+            if comment:
+                new_content.append(comment + '\n' + func.full_text)
+            else:
+                new_content.append(func.full_text)
 
         # Add any remaining non-function blocks
         for block, _ in content_blocks:
@@ -331,41 +492,86 @@ class CppParser:
 
         return '\n\n'.join(new_content)
 
+def write_file_atomic(path, text):
+    """Write text to path without leaving a partial file on interruption
+
+    The content is pre-encoded and written in binary mode (skipping
+    text-mode newline translation) to a temp file in the same directory,
+    then moved into place with os.replace, which is atomic on the same
+    filesystem.
+    """
+    import os
+
+    tmp = str(path) + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(text.encode('utf-8'))
+    os.replace(tmp, str(path))
+
+
+def _header_sidecar_path(header_path):
+    """Sidecar file holding the cached header declaration map"""
+    return header_path.with_name(header_path.name + '.cppparser.json')
+
+
+def _load_header_sidecar(header_path, digest):
+    """Load cached header functions if the sidecar matches the content digest"""
+    import json
+
+    try:
+        with open(_header_sidecar_path(header_path), 'r') as f:
+            data = json.load(f)
+        if (isinstance(data, dict) and data.get('sha') == digest
+                and isinstance(data.get('functions'), dict)):
+            # JSON objects preserve key order, so the declaration order
+            # the reorder step depends on survives the round trip
+            return data['functions']
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_header_sidecar(header_path, digest, functions):
+    """Persist the header declaration map; failures are non-fatal"""
+    import json
+
+    try:
+        with open(_header_sidecar_path(header_path), 'w') as f:
+            json.dump({'sha': digest, 'functions': functions}, f)
+    except OSError:
+        pass
+
+
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description='Reorder C++ functions in implementation file to match header file order')
     parser.add_argument('header', help='Path to the header file (.h)')
     parser.add_argument('implementation', help='Path to the implementation file (.cpp)')
     parser.add_argument('-o', '--output', help='Output file (defaults to overwriting implementation file)')
     parser.add_argument('--dry-run', action='store_true', help='Print result without writing to file')
+    parser.add_argument('--no-header-cache', action='store_true',
+                        help='Do not read or write the <header>.cppparser.json sidecar cache')
 
     args = parser.parse_args()
 
+    header_path = Path(args.header)
+    cpp_path = Path(args.implementation)
+
     # Validate file extensions
-    if not args.header.endswith(('.h', '.hpp')):
+    if header_path.suffix not in ('.h', '.hpp'):
         print(f"Error: Header file should have .h or .hpp extension: {args.header}")
         return 1
 
-    if not args.implementation.endswith(('.cpp', '.cc')):
+    if cpp_path.suffix not in ('.cpp', '.cc'):
         print(f"Error: Implementation file should have .cpp or .cc extension: {args.implementation}")
         return 1
 
-    # Check if files exist
-    if not os.path.isfile(args.header):
-        print(f"Error: Header file not found: {args.header}")
-        return 1
-
-    if not os.path.isfile(args.implementation):
-        print(f"Error: Implementation file not found: {args.implementation}")
-        return 1
-
-    # Read input files
+    # Read input files; a failed read reports the problem directly, so no
+    # separate existence checks (and their extra stat calls) are needed
     try:
-        with open(args.header, 'r') as f:
-            header_content = f.read()
-
-        with open(args.implementation, 'r') as f:
-            cpp_content = f.read()
-    except Exception as e:
+        header_content = header_path.read_text()
+        cpp_content = cpp_path.read_text()
+    except (OSError, UnicodeDecodeError) as e:
         print(f"Error reading files: {e}")
         return 1
 
@@ -373,8 +579,20 @@ def main():
     parser = CppParser()
 
     try:
-        # Extract functions from header file
-        header_functions = parser.extract_header_functions(header_content)
+        # Extract functions from header file, going through the sidecar
+        # cache so batch runs of many cpp files against one header only
+        # pay for the header scan once
+        header_functions = None
+        digest = None
+        if not args.no_header_cache:
+            import hashlib
+            digest = hashlib.sha256(header_content.encode()).hexdigest()
+            header_functions = _load_header_sidecar(header_path, digest)
+
+        if header_functions is None:
+            header_functions = parser.extract_header_functions(header_content)
+            if digest is not None:
+                _write_header_sidecar(header_path, digest, header_functions)
 
         if not header_functions:
             print("Warning: No function declarations found in header file")
@@ -396,8 +614,7 @@ def main():
             print(reordered_content)
         else:
             output_file = args.output or args.implementation
-            with open(output_file, 'w') as f:
-                f.write(reordered_content)
+            write_file_atomic(output_file, reordered_content)
             print(f"Successfully reordered functions in {output_file}")
 
         return 0
@@ -1,8 +1,40 @@
+import os
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
+import queue
 import threading
+from functools import lru_cache
 from pathlib import Path
-from CppParser import CppParser  # Import the CppParser from the main file
+
+
+def _sibling(path, exts):
+    """Find a same-stem sibling of path with one of exts, case-insensitively
+
+    One scandir pass over the directory replaces a stat call per
+    candidate extension — a round trip each on network drives.
+    """
+    directory, base = os.path.split(path)
+    stem = os.path.splitext(base)[0].lower()
+    wanted = {stem + ext for ext in exts}
+    try:
+        with os.scandir(directory or '.') as entries:
+            for entry in entries:
+                if entry.name.lower() in wanted and entry.is_file():
+                    return entry.path
+    except OSError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=32)
+def _read_file(path, mtime):
+    """Read a file, keyed by (path, mtime) so unchanged files aren't re-read
+
+    Callers pass the current mtime; a changed file gets a new key and the
+    stale entry ages out of the LRU.
+    """
+    with open(path, 'r') as f:
+        return f.read()
 
 class CppReorderGUI:
     """GUI Tool for the C++ Function Reordering Tool"""
@@ -19,7 +51,20 @@ class CppReorderGUI:
         self.status = tk.StringVar()
         self.status.set("Ready")
 
+        # One parser reused across runs, so its header/line caches carry
+        # over when the same files are processed again; created lazily on
+        # the first run so importing the parser doesn't delay first paint.
+        # Its caches are not thread-safe, so overlapping runs take turns
+        # through this lock.
+        self.parser = None
+        self._parser_lock = threading.Lock()
+
+        # Log messages from the worker thread are queued and drained on
+        # the Tk thread; widgets must not be touched from other threads
+        self._log_queue = queue.Queue()
+
         self.setup_ui()
+        self.root.after(50, self._drain_log)
 
     def setup_ui(self):
         """Set up the GUI components"""
@@ -89,9 +134,9 @@ class CppReorderGUI:
         if filename:
             self.header_path.set(filename)
             # Automatically set the CPP path
-            cpp_filename = Path(filename).with_suffix('.cpp')
-            if cpp_filename.exists():
-                self.cpp_path.set(str(cpp_filename))
+            cpp_filename = _sibling(filename, ('.cpp', '.cc'))
+            if cpp_filename:
+                self.cpp_path.set(cpp_filename)
             else:
                 messagebox.showwarning("Warning", f"No corresponding .cpp file found for {filename}")
 
@@ -109,16 +154,29 @@ class CppReorderGUI:
             self.cpp_path.set(filename)
 
     def log(self, message):
-        """Add message to log area"""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        """Queue a message for the log area (safe to call from any thread)"""
+        self._log_queue.put_nowait(str(message))
 
-    def log_functions_to_file(self, message):
-        """Log function list to log file"""
-        with open("log.txt", "a") as log_file:
-            log_file.write(message + "\n")
+    def _drain_log(self):
+        """Flush all queued log messages into the widget in one insert"""
+        pending = []
+        try:
+            while True:
+                pending.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if pending:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "\n".join(pending) + "\n")
+            self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+
+        self.root.after(50, self._drain_log)
+
+    def log_functions_to_file(self, log_fh, message):
+        """Log function list to the run's open log file"""
+        log_fh.write(message + "\n")
 
     def process_files(self):
         """Process the selected files"""
@@ -139,60 +197,80 @@ class CppReorderGUI:
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
 
-        # Clear log file
-        with open("log.txt", "w") as log_file:
-            log_file.write("")
-
-        # Update status
+        # Update status; the StringVar change repaints at the next idle
+        # tick on its own, so no forced update_idletasks is needed
         self.status.set("Processing...")
-        self.root.update_idletasks()
 
         # Run the processing in a separate thread to keep the GUI responsive
         threading.Thread(target=self.run_processing, args=(header_file, cpp_file, output_folder_name)).start()
 
     def run_processing(self, header_file, cpp_file, output_folder_name):
         """Run the file processing in a separate thread"""
+        log_fh = None
         try:
-            # Read input files
-            with open(header_file, 'r') as f:
-                header_content = f.read()
-
-            with open(cpp_file, 'r') as f:
-                cpp_content = f.read()
-
-            # Parse files
-            parser = CppParser()
-            header_functions = parser.extract_header_functions(header_content)
-            function_order = {sig: i for i, sig in enumerate(header_functions.keys())}
-            cpp_functions = parser.extract_cpp_functions(cpp_content, header_functions)
-
-            if not cpp_functions:
-                self.log("Warning: No function implementations found in source file")
-                self.status.set("Ready")
-                return
-
-            # Log initial function list
-            self.log_functions_to_file("--- Functions in CPP Before Sorting ---")
-            for func in cpp_functions:
-                self.log_functions_to_file(f"{func.signature} (Line: {func.index})")
-
-            # Reorder implementation functions
-            reordered_content = parser.reorder_cpp_content(cpp_content, function_order, cpp_functions, log_func=self.log)
+            # One buffered handle for the whole run, kept as a local so an
+            # overlapping run can't close it out from under us; opening in
+            # 'w' mode also replaces the old per-click truncation of log.txt
+            log_fh = open("log.txt", "w", buffering=1 << 16)
+            # Read input files (cached across runs for unchanged files).
+            # The two reads hit independent files, so issue them together
+            # and let the OS work on both at once.
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                header_future = executor.submit(
+                    _read_file, header_file, Path(header_file).stat().st_mtime)
+                cpp_future = executor.submit(
+                    _read_file, cpp_file, Path(cpp_file).stat().st_mtime)
+                header_content = header_future.result()
+                cpp_content = cpp_future.result()
+
+            # Parse files (parser module imported here, off the startup path).
+            # The lock keeps a second overlapping run from mutating the
+            # shared parser's caches while this one is mid-parse.
+            from CppParser import CppParser, write_file_atomic
+            with self._parser_lock:
+                if self.parser is None:
+                    self.parser = CppParser()
+                parser = self.parser
+                header_functions = parser.extract_header_functions(header_content)
+                function_order = {sig: i for i, sig in enumerate(header_functions.keys())}
+                cpp_functions = parser.extract_cpp_functions(cpp_content, header_functions)
+
+                if not cpp_functions:
+                    self.log("Warning: No function implementations found in source file")
+                    self.status.set("Ready")
+                    return
+
+                # Log initial function list in one write instead of one
+                # open/write cycle per function
+                self.log_functions_to_file(
+                    log_fh,
+                    "--- Functions in CPP Before Sorting ---\n"
+                    + "\n".join(f"{func.signature} (Line: {func.index})" for func in cpp_functions))
+
+                # Reorder implementation functions
+                reordered_content = parser.reorder_cpp_content(cpp_content, function_order, cpp_functions, log_func=self.log)
 
             # Create output folder if it doesn't exist
             output_folder = Path(output_folder_name)
             output_folder.mkdir(exist_ok=True)
 
-            # Write output file
+            # Write output file (atomic, so an interrupted run can't leave
+            # a truncated source file behind)
             output_file = output_folder / Path(cpp_file).name
-            with open(output_file, 'w') as f:
-                f.write(reordered_content)
-
-            # Log final function list
-            self.log_functions_to_file("--- Functions in CPP After Sorting ---")
-            sorted_functions = parser.extract_cpp_functions(reordered_content, header_functions)
-            for func in sorted_functions:
-                self.log_functions_to_file(f"{func.signature} (Line: {func.index})")
+            write_file_atomic(output_file, reordered_content)
+
+            # Log final function list in one write as well, derived from
+            # the in-memory ordering instead of re-parsing the file that
+            # was just written (original line numbers are stale after the
+            # reorder, so only signatures are logged)
+            unmatched = len(function_order)
+            sorted_functions = sorted(
+                cpp_functions, key=lambda f: function_order.get(f.signature, unmatched))
+            self.log_functions_to_file(
+                log_fh,
+                "--- Functions in CPP After Sorting ---\n"
+                + "\n".join(func.signature for func in sorted_functions))
 
             self.log(f"Successfully reordered functions in {output_file}")
             self.status.set("Ready")
@@ -202,6 +280,9 @@ class CppReorderGUI:
             self.status.set("Ready")
             import traceback
             traceback.print_exc()
+        finally:
+            if log_fh is not None:
+                log_fh.close()
 
 def run_gui():
     """Run the GUI application"""